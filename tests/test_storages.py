@@ -1,18 +1,29 @@
 """Tests for the tinyflux.storages module."""
 
+import copy
 import csv
 from datetime import datetime, timezone, timedelta
+import errno
+import io
+import mmap
 import os
 import random
 import re
 import tempfile
 from typing import Any
+import weakref
 
 import pytest
 
 from tinyflux import TinyFlux, Point
-from tinyflux.queries import TagQuery
-from tinyflux.storages import CSVStorage, MemoryStorage, Storage
+from tinyflux.queries import FieldQuery, TagQuery
+from tinyflux.storages import (
+    ColumnarMemoryStorage,
+    CSVStorage,
+    MemoryStorage,
+    Storage,
+    _deserialize_rows,
+)
 
 random.seed()
 
@@ -129,6 +140,181 @@ def test_csv_kwargs(tmpdir):
     )
 
 
+def test_csv_len(tmpdir, monkeypatch):
+    """Test counting items in a CSV store."""
+    path = os.path.join(tmpdir, "test.csv")
+    storage = CSVStorage(path)
+    assert len(storage) == 0
+
+    t = datetime.now(timezone.utc)
+    storage.append([storage._serialize_point(Point(time=t)) for _ in range(3)])
+    assert len(storage) == 3
+    storage.close()
+
+    # Last line without a terminating newline.
+    with open(path, "a") as f:
+        f.write(f"{t.replace(tzinfo=None).isoformat()},_default")
+
+    storage = CSVStorage(path)
+    assert len(storage) == 4
+    assert len(storage.read()) == 4
+    storage.close()
+
+    # Line terminator without a newline.
+    path = os.path.join(tmpdir, "test_cr.csv")
+    storage = CSVStorage(path, lineterminator="\r")
+    assert len(storage) == 0
+
+    storage.append([storage._serialize_point(Point(time=t)) for _ in range(3)])
+    assert len(storage) == 3
+    assert len(storage.read()) == 3
+    storage.close()
+
+    # Encoding that is not ASCII-compatible, with a value that contains a
+    # newline byte when encoded.
+    path = os.path.join(tmpdir, "test_utf16.csv")
+    storage = CSVStorage(path, encoding="utf-16")
+    assert len(storage) == 0
+
+    points = [Point(time=t, tags={"a": "\u010a"}) for _ in range(3)]
+    storage.append([storage._serialize_point(p) for p in points])
+    assert len(storage) == 3
+    assert storage.read() == points
+    storage.close()
+
+    # Relative path after a change of working directory.
+    cwd = os.getcwd()
+    monkeypatch.chdir(tmpdir)
+    storage = CSVStorage("test_rel.csv")
+    storage.append([storage._serialize_point(Point(time=t))])
+    monkeypatch.chdir(cwd)
+    assert len(storage) == 1
+    storage.close()
+
+
+def test_csv_fast_iteration(tmpdir):
+    """Test iterating over a CSV store without the csv module."""
+    path = os.path.join(tmpdir, "test.csv")
+    t = datetime.now(timezone.utc)
+    points = [
+        Point(time=t, tags={"city": "los angeles"}, fields={"a": 1}),
+        Point(time=t, tags={"city": 'la, "california"'}, fields={"a": 2}),
+        Point(time=t, tags={"city": "la\r\nca"}, fields={"a": 3}),
+        Point(time=t, tags={"city": "nyc"}, fields={"a": 4}),
+    ]
+
+    storage = CSVStorage(path, fast_csv=True)
+    assert storage._fast_csv
+    storage.append([storage._serialize_point(p) for p in points])
+    assert storage.read() == points
+    assert list(storage) == list(CSVStorage(path))
+    storage.close()
+
+    # Delimiters are respected.
+    storage = CSVStorage(path, fast_csv=True, delimiter="|")
+    assert storage._fast_csv
+    storage.reset()
+    storage.append([storage._serialize_point(p) for p in points])
+    assert storage.read() == points
+    storage.close()
+
+    # Other dialect options fall back to the csv module.
+    storage = CSVStorage(path, fast_csv=True, skipinitialspace=True)
+    assert not storage._fast_csv
+    storage.close()
+
+
+def test_csv_mmap_reads(tmpdir, monkeypatch):
+    """Test reading a CSV store through a memory map."""
+    path = os.path.join(tmpdir, "test.csv")
+    t = datetime.now(timezone.utc)
+    points = [
+        Point(time=t, tags={"city": "los angeles"}, fields={"a": 1}),
+        Point(time=t, tags={"city": "la\r\nca"}, fields={"a": 2}),
+        Point(time=t, tags={"city": "nyc"}, fields={"a": 3}),
+    ]
+
+    for fast_csv in (False, True):
+        storage = CSVStorage(path, mmap_reads=True, fast_csv=fast_csv)
+        assert storage._mmap_reads
+        assert storage.read() == []
+
+        storage.append([storage._serialize_point(p) for p in points])
+        assert storage.read() == points
+        assert list(storage) == list(CSVStorage(path))
+        storage.reset()
+        storage.close()
+
+    # Encodings that are not ASCII-compatible use the file object.
+    storage = CSVStorage(path, mmap_reads=True, encoding="utf-16")
+    assert not storage._mmap_reads
+    storage.close()
+
+    # Files that cannot be mapped are read through the file object.
+    storage = CSVStorage(path, mmap_reads=True)
+    storage.append([storage._serialize_point(p) for p in points])
+
+    def fail_mmap(*args: Any, **kwargs: Any) -> None:
+        """Fail to map a file."""
+        raise OSError
+
+    monkeypatch.setattr(mmap, "mmap", fail_mmap)
+    assert storage.read() == points
+    assert list(storage) == list(CSVStorage(path))
+    storage.close()
+
+
+def test_csv_advise_sequential(tmpdir, monkeypatch):
+    """Test that unsupported access pattern hints are ignored."""
+    path = os.path.join(tmpdir, "test.csv")
+
+    def fail_fadvise(*args: Any) -> None:
+        """Fail as for a file that is not a regular file."""
+        raise OSError(errno.ESPIPE, os.strerror(errno.ESPIPE))
+
+    monkeypatch.setattr(os, "posix_fadvise", fail_fadvise, raising=False)
+    monkeypatch.setattr(os, "POSIX_FADV_SEQUENTIAL", 2, raising=False)
+
+    # Init and the temp file swap both advise the OS.
+    db = TinyFlux(path)
+    db.insert_multiple([Point(tags={"a": str(i)}) for i in range(3)])
+    assert db.remove(TagQuery().a == "0") == 1
+    assert len(db) == 2
+    db.close()
+
+
+def test_csv_format_rows(tmpdir):
+    """Test formatting rows without the csv module."""
+    path = os.path.join(tmpdir, "test.csv")
+    rows = [
+        ("2020-01-01T00:00:00", "_default", "_tag_a", "b"),
+        ("2020-01-01T00:00:00", "m", "_tag_a", "b, c"),
+        ("2020-01-01T00:00:00", "m", "_tag_a", 'say "hi"'),
+        ("2020-01-01T00:00:00", "m", "_tag_a", "b\nc"),
+        ("2020-01-01T00:00:00", "m", "_field_a", 1.0),
+        ("2020-01-01T00:00:00", "", "_tag_a", ""),
+        ("",),
+    ]
+
+    for kwargs in ({}, {"delimiter": "|"}, {"lineterminator": "\n"}):
+        storage = CSVStorage(path, **kwargs)
+        assert storage._needs_quoting is not None
+
+        buf = io.StringIO(newline="")
+        csv.writer(buf, **kwargs).writerows(rows)
+        assert storage._format_rows(rows) == buf.getvalue()
+        storage.close()
+
+    # Other dialect options always use the csv module.
+    storage = CSVStorage(path, quoting=csv.QUOTE_ALL)
+    assert storage._needs_quoting is None
+    storage.append([rows[0]])
+    storage.close()
+
+    with open(path) as f:
+        assert f.read().startswith('"2020-01-01T00:00:00"')
+
+
 def test_create_dirs():
     """Test creation of directories for DB path."""
     temp_dir = tempfile.gettempdir()
@@ -201,6 +387,52 @@ def test_in_memory_close():
     db.close()
 
 
+def test_columnar_memory_storage():
+    """Test ColumnarMemoryStorage against MemoryStorage."""
+    t = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    points = [
+        Point(
+            time=t + timedelta(seconds=i),
+            measurement=f"m{i % 2}",
+            tags={"a": str(i % 3)},
+            fields={"b": i},
+        )
+        for i in range(10)
+    ]
+
+    db1 = TinyFlux(storage=MemoryStorage)
+    db2 = TinyFlux(storage=ColumnarMemoryStorage)
+    assert len(db2) == 0
+
+    for db in (db1, db2):
+        db.insert_multiple(copy.deepcopy(points))
+
+    assert len(db2) == len(db2.storage) == 10
+    assert db2.all() == db1.all() == points
+    assert db2.get_timestamps() == db1.get_timestamps()
+    assert db2.search(TagQuery().a == "1") == db1.search(TagQuery().a == "1")
+
+    for db in (db1, db2):
+        db.update(TagQuery().a == "0", fields={"b": -1})
+        db.remove(FieldQuery().b == 5)
+
+    assert db2.all() == db1.all()
+    assert db2.count(FieldQuery().b == -1) == 4
+
+    # Naive timestamps are stored as UTC.
+    storage = ColumnarMemoryStorage()
+    item = storage._serialize_point(Point(time=t.replace(tzinfo=None)))
+    assert storage._deserialize_timestamp(item) == t
+    assert storage._deserialize_measurement(item) == "_default"
+
+    with pytest.raises(ValueError):
+        storage._serialize_point(Point())
+
+    db2.remove_all()
+    assert db2.all() == []
+    assert len(db2.storage) == 0
+
+
 def test_subclassing_storage():
     """Test subclassing ABC Storage without defining abstract methods."""
 
@@ -257,6 +489,21 @@ def test_subclassing_storage():
     MyStorage2()
 
 
+def test_storage_weakref(tmpdir):
+    """Test weak references to the storage classes."""
+    path = os.path.join(tmpdir, "test.csv")
+
+    for storage in (
+        CSVStorage(path),
+        MemoryStorage(),
+        ColumnarMemoryStorage(),
+    ):
+        ref = weakref.ref(storage)
+        assert ref() is storage
+
+        storage.close()
+
+
 def test_read_and_insert_count(mem_storage_with_counters):
     """Test read/write counts after a sequence of read/write ops."""
     with TinyFlux(auto_index=True, storage=mem_storage_with_counters) as db:
@@ -568,6 +815,45 @@ def test_multiple_reads(
         assert storage.write_count == 0
 
 
+def test_read_iter(tmpdir):
+    """Test lazily reading from storage."""
+    t = datetime.now(timezone.utc)
+    points = [Point(time=t, fields={"a": i}) for i in range(3)]
+
+    for storage in (
+        MemoryStorage(),
+        CSVStorage(os.path.join(tmpdir, "test.csv")),
+    ):
+        assert list(storage.read_iter()) == []
+        storage.append([storage._serialize_point(p) for p in points])
+
+        rst = storage.read_iter()
+        assert not isinstance(rst, list)
+        assert list(rst) == points == storage.read()
+        storage.close()
+
+
+def test_parallel_read(tmpdir):
+    """Test deserializing reads in a process pool."""
+    path = os.path.join(tmpdir, "test.csv")
+    t = datetime.now(timezone.utc)
+    points = [Point(time=t, tags={"a": str(i)}) for i in range(20)]
+
+    # Below the threshold.
+    storage = CSVStorage(path, parallel_read=True)
+    storage.append([storage._serialize_point(p) for p in points])
+    assert storage.read() == points
+    storage.close()
+
+    # Above the threshold.
+    storage = CSVStorage(path, parallel_read=True, parallel_read_min_rows=10)
+    assert storage.read() == points
+
+    # Worker processes deserialize chunks of rows.
+    assert _deserialize_rows(list(storage)) == points
+    storage.close()
+
+
 def test_read_on_empty_file(tmpdir, csv_storage_with_counters):
     """Test read method on empty file."""
     path = os.path.join(tmpdir, "test.csv")
@@ -624,6 +910,116 @@ def test_flush_on_insert(tmpdir):
     assert db.all() == [p1, p2]
 
 
+def test_flush_thresholds(tmpdir):
+    """Test buffered appends with flush thresholds."""
+    path = os.path.join(tmpdir, "test.csv")
+    t = datetime.now(timezone.utc)
+
+    # Row threshold.
+    storage = CSVStorage(path, flush_threshold_rows=3)
+    storage.append([storage._serialize_point(Point(time=t))] * 2)
+    assert os.path.getsize(path) == 0
+    storage.append([storage._serialize_point(Point(time=t))])
+    assert os.path.getsize(path) > 0
+    storage.reset()
+
+    # Byte threshold.
+    storage = CSVStorage(path, flush_threshold_bytes=1 << 20)
+    storage.append([storage._serialize_point(Point(time=t))])
+    assert os.path.getsize(path) == 0
+
+    # Reads see buffered appends.
+    assert len(storage) == 1
+    assert storage.read() == [Point(time=t)]
+
+    # Close flushes the buffer.
+    storage.append([storage._serialize_point(Point(time=t))])
+    storage.close()
+    assert len(CSVStorage(path)) == 2
+
+    # Buffered appends are discarded on reset.
+    storage = CSVStorage(path, flush_threshold_rows=10)
+    storage.append([storage._serialize_point(Point(time=t))])
+    storage.reset()
+    storage.close()
+    assert os.path.getsize(path) == 0
+
+
+def test_sync_policy(tmpdir, monkeypatch):
+    """Test syncing appends to disk by size and time thresholds."""
+    path = os.path.join(tmpdir, "test.csv")
+    t = datetime.now(timezone.utc)
+    syncs = []
+    fsync = os.fsync
+
+    def counting_fsync(fd):
+        syncs.append(fd)
+        fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", counting_fsync)
+
+    # Every append is synced by default.
+    storage = CSVStorage(path)
+    item = storage._serialize_point(Point(time=t))
+    storage.append([item])
+    storage.append([item])
+    assert len(syncs) == 2
+    storage.close()
+    assert len(syncs) == 2
+
+    # Size threshold.
+    syncs.clear()
+    storage = CSVStorage(path, sync_threshold_bytes=1 << 20)
+    storage.append([item])
+    storage.append([item])
+    assert not syncs
+    assert len(storage) == 4
+
+    # Explicit sync and sync on close.
+    storage.sync()
+    assert len(syncs) == 1
+    storage.append([item])
+    storage.close()
+    assert len(syncs) == 2
+
+    # Time threshold.
+    syncs.clear()
+    storage = CSVStorage(
+        path, sync_threshold_bytes=1 << 20, sync_interval=3600.0
+    )
+    storage.append([item])
+    assert not syncs
+    storage._last_sync -= 3600.0
+    storage.append([item])
+    assert len(syncs) == 1
+    storage.close()
+
+    # Rows written by csv.writer are synced on close.
+    syncs.clear()
+    storage = CSVStorage(path, sync_interval=3600.0, quoting=csv.QUOTE_ALL)
+    storage.append([item])
+    assert not syncs
+    storage.close()
+    assert len(syncs) == 1
+
+    # Characters written by csv.writer count towards the size threshold.
+    syncs.clear()
+    storage = CSVStorage(path, sync_threshold_bytes=1, quoting=csv.QUOTE_ALL)
+    storage.append([item])
+    storage.append([item])
+    assert len(syncs) == 2
+    storage.close()
+    assert len(syncs) == 2
+
+    # No syncing without flush_on_insert.
+    syncs.clear()
+    storage = CSVStorage(path, flush_on_insert=False)
+    storage.append([item])
+    storage.close()
+    assert not syncs
+    assert len(CSVStorage(path)) == 11
+
+
 def test_write(tmpdir):
     """Test write method."""
     path = os.path.join(tmpdir, "test.csv")
@@ -645,6 +1041,131 @@ def test_temporary_storage(tmpdir):
         storage.append([], temporary=True)
 
 
+def test_temporary_storage_cleanup(tmpdir):
+    """Test that temporary storage does not leave files behind."""
+    path = os.path.join(tmpdir, "test.csv")
+    db = TinyFlux(path)
+    db.insert_multiple([Point(tags={"a": str(i)}) for i in range(3)])
+
+    # Swapped into place.
+    assert db.remove(TagQuery().a == "0") == 1
+    assert os.listdir(tmpdir) == ["test.csv"]
+    assert len(db) == 2
+
+    # The swapped-in file can be appended to and read.
+    db.insert(Point(tags={"a": "3"}))
+    db.insert(Point(tags={"a": "4"}))
+    assert len(CSVStorage(path)) == len(db.storage) == 4
+    assert db.count(TagQuery().a.exists()) == 4
+
+    # Nothing removed, never swapped.
+    assert db.remove(TagQuery().a == "5") == 0
+    assert os.listdir(tmpdir) == ["test.csv"]
+    db.close()
+
+    # A symlinked path keeps its link, and the target is rewritten.
+    real_dir = os.path.join(tmpdir, "real")
+    os.mkdir(real_dir)
+    real_path = os.path.join(real_dir, "db.csv")
+    link_path = os.path.join(tmpdir, "link.csv")
+    open(real_path, "w").close()
+
+    try:
+        os.symlink(real_path, link_path)
+    except (OSError, NotImplementedError):  # pragma: no cover
+        return
+
+    db = TinyFlux(link_path)
+    db.insert_multiple([Point(tags={"a": str(i)}) for i in range(3)])
+    assert db.remove(TagQuery().a == "0") == 1
+    assert os.path.islink(link_path)
+    assert os.listdir(real_dir) == ["db.csv"]
+    assert len(CSVStorage(real_path)) == len(db) == 2
+    db.close()
+
+
+def test_temporary_storage_swap_handles(tmpdir, monkeypatch):
+    """Test both ways of swapping in the primary file object."""
+    path = os.path.join(tmpdir, "test.csv")
+    db = TinyFlux(path)
+    db.insert_multiple([Point(tags={"a": str(i)}) for i in range(4)])
+
+    # Record the reuse decision and the tempfile object it applies to.
+    temp_handle_reusable = CSVStorage._temp_handle_reusable
+    decisions = []
+
+    def record_temp_handle_reusable(self: CSVStorage) -> bool:
+        """Record the decision to reuse the tempfile object."""
+        decisions.append((temp_handle_reusable(self), self._temp_handle))
+        return decisions[-1][0]
+
+    monkeypatch.setattr(
+        CSVStorage, "_temp_handle_reusable", record_temp_handle_reusable
+    )
+
+    # The renamed tempfile's object becomes the primary file object, except
+    # on Windows, where open files cannot be renamed.
+    assert db.remove(TagQuery().a == "0") == 1
+    reused, temp_handle = decisions.pop()
+    assert reused == (os.name != "nt")
+    assert (db.storage._handle is temp_handle) == reused
+    assert isinstance(db.storage._handle, io.TextIOWrapper)
+    assert len(db.storage) == 3
+
+    # Otherwise, the primary file is reopened.
+    monkeypatch.setattr(CSVStorage, "_temp_handle_reusable", lambda self: False)
+    temp_handle = db.storage._handle
+    assert db.remove(TagQuery().a == "1") == 1
+    assert db.storage._handle is not temp_handle
+    assert isinstance(db.storage._handle, io.TextIOWrapper)
+    assert db.storage._handle.name == path
+    assert db.storage._handle.mode == "r+"
+    assert len(db.storage) == 2
+
+    # Either file object can be appended to and read.
+    db.insert(Point(tags={"a": "4"}))
+    assert len(CSVStorage(path)) == 3
+    assert db.count(TagQuery().a.exists()) == 3
+    db.close()
+
+
+def test_temporary_storage_fallback_dir(tmpdir, monkeypatch):
+    """Test temporary storage when the database directory is not writable."""
+    mkstemp = tempfile.mkstemp
+    errors = [
+        PermissionError(errno.EACCES, os.strerror(errno.EACCES)),
+        OSError(errno.EROFS, os.strerror(errno.EROFS)),
+    ]
+
+    def no_dir_mkstemp(*args: Any, **kwargs: Any) -> Any:
+        """Refuse to create tempfiles in the database directory."""
+        if "dir" in kwargs:
+            raise error
+
+        return mkstemp(*args, **kwargs)
+
+    monkeypatch.setattr("tinyflux.storages.mkstemp", no_dir_mkstemp)
+
+    for n, error in enumerate(errors):
+        path = os.path.join(tmpdir, f"test{n}.csv")
+        db = TinyFlux(path)
+        db.insert_multiple([Point(tags={"a": str(i)}) for i in range(3)])
+        mode = os.stat(path).st_mode
+
+        # Contents are copied over the primary file, which is kept in place.
+        assert db.remove(TagQuery().a == "0") == 1
+        assert sorted(os.listdir(tmpdir)) == [
+            f"test{i}.csv" for i in range(n + 1)
+        ]
+        assert os.stat(path).st_mode == mode
+        assert len(CSVStorage(path)) == len(db) == 2
+
+        # The reopened file can be appended to and read.
+        db.insert(Point(tags={"a": "3"}))
+        assert db.count(TagQuery().a.exists()) == 3
+        db.close()
+
+
 def test_compact_key_prefixes(tmpdir):
     """Test compact keys option."""
     # Memory.
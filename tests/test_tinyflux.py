@@ -590,6 +590,11 @@ def test_insert_multiple():
     db = TinyFlux(storage=MemoryStorage)
     assert db.storage._initially_empty
 
+    # Insert nothing.
+    assert db.insert_multiple([]) == 0
+    assert len(db) == 0
+    assert db.index.valid
+
     db.insert_multiple([Point() for _ in range(2)])
     assert len(db) == 2
 
@@ -618,6 +623,38 @@ def test_insert_multiple():
     with pytest.raises(TypeError, match="Data must be a Point instance."):
         db.insert_multiple([Point(), 3])
 
+    # Nothing from the invalid batch was written.
+    assert len(db) == 8
+
+
+def test_insert_multiple_batches(monkeypatch):
+    """Test insert_multiple with more points than fit in one batch."""
+    monkeypatch.setattr(TinyFlux, "_insert_batch_size", 2)
+    db = TinyFlux(storage=MemoryStorage)
+    t = datetime.now(timezone.utc)
+
+    # In-order batches extend the index.
+    assert (
+        db.insert_multiple(
+            Point(time=t + timedelta(seconds=i)) for i in range(5)
+        )
+        == 5
+    )
+    assert len(db) == 5
+    assert db.index.valid
+    assert len(db.index) == 5
+
+    # A batch earlier than the previous one invalidates the index.
+    db.insert_multiple([Point(time=t + timedelta(seconds=i)) for i in (9, 8)])
+    assert len(db) == 7
+    assert not db.index.valid
+
+    # Batches before an invalid one are kept.
+    with pytest.raises(TypeError, match="Data must be a Point instance."):
+        db.insert_multiple([Point(), Point(), Point(), 3])
+
+    assert len(db) == 9
+
 
 def test_measurement():
     """Test measurement method."""
@@ -1,11 +1,14 @@
 """Tests for tinyflux.utils module."""
 
+from datetime import datetime, timezone
+
 import pytest
 
 from tinyflux.utils import (
     freeze,
     FrozenDict,
     find_eq,
+    find_eq_range,
     find_ge,
     find_gt,
     find_le,
@@ -34,6 +37,11 @@ def test_freeze():
     with pytest.raises(TypeError):
         frozen[3].update({"a": 9})
 
+    # Other hashable values are returned unchanged.
+    t = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    assert freeze(t) is t
+    assert freeze((1, 2)) == (1, 2)
+
 
 def test_frozen_dict_hash():
     """Test the hash function on FrozenDict class."""
@@ -45,6 +53,14 @@ def test_frozen_dict_hash():
     assert hash(my_frozen_set1) != hash(my_frozen_set3)
     assert hash(my_frozen_set2) != hash(my_frozen_set3)
 
+    # Keys of mixed types cannot be sorted, but can still be hashed.
+    my_frozen_set4 = FrozenDict({1: "a", "b": 2})
+    my_frozen_set5 = FrozenDict({"b": 2, 1: "a"})
+    assert hash(my_frozen_set4) == hash(my_frozen_set5)
+
+    # The hash is cached after the first call.
+    assert my_frozen_set4._hash == hash(my_frozen_set4)
+
 
 def test_find_eq():
     """Test the find_eq function."""
@@ -70,6 +86,23 @@ def test_find_eq():
         assert find_eq(my_list, n) is None
 
 
+def test_find_eq_range():
+    """Test the find_eq_range function."""
+    my_list = [0, 1, 1, 1, 2, 4]
+
+    assert find_eq_range(my_list, 0) == (0, 1)
+    assert find_eq_range(my_list, 1) == (1, 4)
+    assert find_eq_range(my_list, 4) == (5, 6)
+
+    # Absent values give an empty run at their insertion point.
+    assert find_eq_range(my_list, -1) == (0, 0)
+    assert find_eq_range(my_list, 3) == (5, 5)
+    assert find_eq_range(my_list, 5) == (6, 6)
+
+    # Empty list.
+    assert find_eq_range([], 0) == (0, 0)
+
+
 def test_find_lt():
     """Test the find_lt function."""
     present_numbers = range(3, 6)
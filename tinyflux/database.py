@@ -3,6 +3,7 @@
 import copy
 from datetime import datetime, timezone
 from functools import wraps
+from itertools import islice
 from typing import (
     Any,
     Callable,
@@ -148,6 +149,9 @@ class TinyFlux:
     # The class that will be used by default to create storage instances.
     default_storage_class = CSVStorage
 
+    # The maximum number of points validated and written as one batch.
+    _insert_batch_size = 10000
+
     _auto_index: bool
     _storage: Storage
     _index: Index
@@ -215,8 +219,7 @@ class TinyFlux:
 
     def __iter__(self) -> Iterator[Point]:
         """Return an iterator for all Points in the storage layer."""
-        for item in self._storage:
-            yield self._storage._deserialize_storage_item(item)
+        yield from self._storage.read_iter()
 
     def __len__(self) -> int:
         """Get the number of Points in the storage layer."""
@@ -702,6 +705,11 @@ class TinyFlux:
     ) -> int:
         """Insert Points into the database.
 
+        Points are validated and written in batches of up to 10,000, so
+        inserting from a generator does not hold every Point in memory. If a
+        batch contains an object that is not a Point, none of that batch is
+        written, but earlier batches are kept.
+
         Args:
             points: An iterable of Point objects.
             measurement: An optional measurement to insert Points into.
@@ -759,9 +767,7 @@ class TinyFlux:
             return
 
         # Build the index.
-        self._index.build(
-            self._storage._deserialize_storage_item(i) for i in self._storage
-        )
+        self._index.build(self._storage.read_iter())
 
         return
 
@@ -1302,45 +1308,66 @@ class TinyFlux:
             Count of number of updates made.
         """
         t = datetime.now(timezone.utc)
+        points = iter(points)
         count = 0
 
-        for point in points:
-            if not isinstance(point, Point):
-                raise TypeError("Data must be a Point instance.")
+        # Validate, write, and index the points in batches of bounded size.
+        while True:
+            new_points: List[Point] = []
+
+            # Check index: extend it if the batch is in time order and starts
+            # no earlier than the latest indexed time, otherwise invalidate it.
+            check_index = self._auto_index and self._index.valid
+            latest_time = (
+                self._index.latest_time
+                if check_index and not self._index.empty
+                else None
+            )
+            in_order = True
+
+            for point in islice(points, self._insert_batch_size):
+                if not isinstance(point, Point):
+                    raise TypeError("Data must be a Point instance.")
 
-            # Update the measurement name if it doesn't match.
-            if measurement and point.measurement != measurement:
-                point.measurement = measurement
+                # Update the measurement name if it doesn't match.
+                if measurement and point.measurement != measurement:
+                    point.measurement = measurement
 
-            # Add time if not exists.
-            if point.time:
-                point.time = point.time.astimezone(timezone.utc)
-            else:
-                point.time = t
+                # Add time if not exists.
+                p_time = (
+                    point.time.astimezone(timezone.utc) if point.time else t
+                )
+                point.time = p_time
+
+                if latest_time and p_time < latest_time:
+                    in_order = False
 
-            # Insert the points into storage.
+                latest_time = p_time
+                new_points.append(point)
+
+            if not new_points:
+                break
+
+            # Insert the points into storage in a single batch.
+            serialize = self._storage._serialize_point
             self._storage.append(
                 [
-                    self._storage._serialize_point(
-                        point, compact_key_prefixes=compact_key_prefixes
-                    )
+                    serialize(point, compact_key_prefixes=compact_key_prefixes)
+                    for point in new_points
                 ]
             )
+            count += len(new_points)
 
-            # Check index.
-            if self._auto_index and self._index.valid:
-                if (
-                    not self._index.empty
-                    and point.time < self._index.latest_time
-                ):
-                    self._index.invalidate()
-                else:
-                    self._index.insert([point])
+            if check_index and in_order:
+                self._index.insert(new_points)
+            elif check_index:
+                self._index.invalidate()
 
-            count += 1
+        if not count:
+            return 0
 
         # Invalidate index.
-        if count and not self._auto_index and self._index.valid:
+        if not self._auto_index and self._index.valid:
             self._index.invalidate()
 
         return count
@@ -1610,9 +1637,6 @@ class TinyFlux:
 
         # If any item was updated, rebuild the in-memory index.
         if self._auto_index:
-            self._index.build(
-                self._storage._deserialize_storage_item(i)
-                for i in self._storage
-            )
+            self._index.build(self._storage.read_iter())
 
         return update_count
@@ -15,7 +15,7 @@ from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from tinyflux.queries import SimpleQuery, CompoundQuery, Query
 from .point import FieldSet, FieldValue, Point, TagSet
-from .utils import find_eq, find_lt, find_le, find_gt, find_ge
+from .utils import find_eq_range, find_lt, find_le, find_gt, find_ge
 
 
 class IndexResult:
@@ -57,10 +57,11 @@ class IndexResult:
         Usage:
             >>> ~IndexResult()
         """
-        return IndexResult(
-            set(range(self._index_count)).difference(self._items),
-            self._index_count,
-        )
+        # Remove matches in place rather than building a second set.
+        complement = set(range(self._index_count))
+        complement.difference_update(self._items)
+
+        return IndexResult(complement, self._index_count)
 
     def __and__(self, other: "IndexResult") -> "IndexResult":
         """Return the intersection of two IndexResults as one IndexResult.
@@ -729,43 +730,20 @@ class Index:
 
         # Exact timestamp match.
         if op == operator.eq:
-            # Find the exact match, or return empty set if None.
-            match = find_eq(self._timestamps, rhs.timestamp())
-            if match is None:
-                return set([])
-
-            # Find the other timestamps with same value.
-            results = set([self._storage_pos_sorted_by_ts[match]])
-            match += 1
+            # Find the run of timestamps with this value.
+            start, stop = find_eq_range(self._timestamps, rhs.timestamp())
 
-            while match < len(self._timestamps):
-                if self._timestamps[match] != rhs.timestamp():
-                    break
-
-                results.add(self._storage_pos_sorted_by_ts[match])
-                match += 1
-
-            return results
+            return set(self._storage_pos_sorted_by_ts[start:stop])
 
         # Anything except exact timestamp match.
         elif op == operator.ne:
-            # Find the exact match, or return full set if None.
-            match = find_eq(self._timestamps, rhs.timestamp())
-            if match is None:
-                return set(self._storage_pos_sorted_by_ts)
+            # Find the run of timestamps with this value, and exclude it.
+            start, stop = find_eq_range(self._timestamps, rhs.timestamp())
 
-            # Find the other timestamps with same value.
-            results = set([self._storage_pos_sorted_by_ts[match]])
-            match += 1
+            results = set(self._storage_pos_sorted_by_ts[:start])
+            results.update(self._storage_pos_sorted_by_ts[stop:])
 
-            while match < len(self._timestamps):
-                if self._timestamps[match] != rhs.timestamp():
-                    break
-
-                results.add(self._storage_pos_sorted_by_ts[match])
-                match += 1
-
-            return set(self._storage_pos_sorted_by_ts).difference(results)
+            return results
 
         # Everything less than rhs.
         elif op == operator.lt:
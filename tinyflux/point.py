@@ -97,6 +97,7 @@ class Point:
     """
 
     _none_str = "_none"
+    _utc_offset_str = "+00:00"
     default_measurement_name = "_default"
     _valid_kwargs = set(["time", "measurement", "tags", "fields"])
     __slots__ = ("_time", "_measurement", "_tags", "_fields")
@@ -243,48 +244,65 @@ class Point:
         Returns:
             A Point object.
         """
-        p_time = datetime.fromisoformat(row[0]).replace(tzinfo=timezone.utc)
+        # Time is serialized as naive UTC. Parsing it with a UTC offset is
+        # cheaper than replacing the tzinfo of a naive datetime afterwards.
+        try:
+            p_time = datetime.fromisoformat(row[0] + self._utc_offset_str)
+        except ValueError:
+            p_time = datetime.fromisoformat(row[0]).replace(tzinfo=timezone.utc)
+
         p_measurement = row[1]
 
         p_tags: TagSet = {}
         p_fields: FieldSet = {}
 
+        # Bind per-row lookups to locals for the loops below.
+        none_str = self._none_str
+        default_tag_len = len(self._default_tag_key_prefix)
+        compact_tag_len = len(self._compact_tag_key_prefix)
+        default_field_len = len(self._default_field_key_prefix)
+        compact_field_len = len(self._compact_field_key_prefix)
+
         row_len = len(row)
         i = 2
 
         # Check for tag key/values.
         while i < row_len:
+            key = row[i]
+
             # Default tag key prefix is "_tag_" (most-used case).
-            if row[i][1] == "t":
-                t_key = row[i][len(self._default_tag_key_prefix) :]
+            if key[1] == "t":
+                t_key = key[default_tag_len:]
             # Compact tag key prefix is "t_".
-            elif row[i][0] == "t":
-                t_key = row[i][len(self._compact_tag_key_prefix) :]
+            elif key[0] == "t":
+                t_key = key[compact_tag_len:]
             # Otherwise, its a field -> continue.
             else:
                 break
 
-            t_value = None if row[i + 1] == self._none_str else str(row[i + 1])
-            p_tags[t_key] = t_value
+            t_value = row[i + 1]
+            p_tags[t_key] = None if t_value == none_str else t_value
             i += 2
 
         # Check for field key/values.
         while i < row_len:
+            key = row[i]
+
             # Default field key prefix is "_field_" (most-used case).
-            if row[i][1] == "f":
-                f_key = row[i][len(self._default_field_key_prefix) :]
+            if key[1] == "f":
+                f_key = key[default_field_len:]
             # Compact field key prefix is "f_".
             else:
-                f_key = row[i][len(self._compact_field_key_prefix) :]
+                f_key = key[compact_field_len:]
 
             f_value = row[i + 1]
+            i += 2
 
             # Value is an integer.
             if f_value.isdigit() or (
                 f_value[0] == "-" and f_value[1:].isdigit()
             ):
                 p_fields[f_key] = int(f_value)
-                i += 2
                 continue
 
             # Value is a float.
@@ -295,8 +313,6 @@ class Point:
             except Exception:
                 p_fields[f_key] = None
 
-            i += 2
-
         self._time = p_time
         self._measurement = p_measurement
         self._tags = p_tags
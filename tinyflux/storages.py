@@ -15,20 +15,29 @@ Usage:
 """
 
 from abc import ABC, abstractmethod
+from array import array
 import csv
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+import io
+from itertools import chain
+import locale
+import mmap
 import os
 from pathlib import Path
+import re
 import shutil
-from tempfile import NamedTemporaryFile
+import sys
+from tempfile import mkstemp
+import time
 
-from typing import Any, Iterator, List, Optional, Sequence, Union
-import _csv
+from typing import Any, Iterator, List, Optional, Sequence, Tuple, Union
 
-from .point import Point
+from .point import FieldSet, Point, TagSet
 
 MemStorageItem = Point
 CSVStorageItem = Sequence[str]
+ColumnarStorageItem = Tuple[int, str, TagSet, FieldSet]
+ColumnarColumns = Tuple["array[int]", List[str], List[TagSet], List[FieldSet]]
 
 
 def create_file(path: Union[str, Path], create_dirs: bool) -> None:
@@ -53,6 +62,19 @@ def create_file(path: Union[str, Path], create_dirs: bool) -> None:
     return
 
 
+def _deserialize_rows(rows: List[CSVStorageItem]) -> List[Point]:
+    """Deserialize a chunk of CSV rows to Points in a worker process.
+
+    Args:
+        rows: A list of rows.
+
+    Returns:
+        A list of Points.
+    """
+    new_point = Point.__new__
+    return [new_point(Point)._deserialize_from_list(row) for row in rows]
+
+
 class Storage(ABC):  # pragma: no cover
     """The abstract base class for all storage types for TinyFlux.
 
@@ -65,6 +87,9 @@ class Storage(ABC):  # pragma: no cover
                 ...
     """
 
+    # Storages can still be weakly referenced.
+    __slots__ = ("__weakref__",)
+
     _initially_empty: bool
 
     @property
@@ -83,7 +108,9 @@ class Storage(ABC):  # pragma: no cover
         return True
 
     @abstractmethod
-    def __iter__(self) -> Iterator[Union[MemStorageItem, CSVStorageItem]]:
+    def __iter__(
+        self,
+    ) -> Iterator[Union[MemStorageItem, CSVStorageItem, ColumnarStorageItem]]:
         """Return a generator for items in storage."""
         ...
 
@@ -119,7 +146,16 @@ class Storage(ABC):  # pragma: no cover
         Returns:
             A list of Points.
         """
-        return list(self._deserialize_storage_item(i) for i in iter(self))
+        deserialize = self._deserialize_storage_item
+        return [deserialize(i) for i in self]
+
+    def read_iter(self) -> Iterator[Point]:
+        """Lazily read from the store.
+
+        Returns:
+            An iterator of Points.
+        """
+        return map(self._deserialize_storage_item, self)
 
     @abstractmethod
     def reset(self) -> None:
@@ -180,6 +216,44 @@ class CSVStorage(Storage):
 
     _timestamp_idx = 0
     _measurement_idx = 1
+    _read_chunk_size = 1 << 20
+    __slots__ = (
+        "_buf_csv_writer",
+        "_buf_rows",
+        "_buffering",
+        "_byte_lines",
+        "_can_append",
+        "_can_read",
+        "_can_write",
+        "_csv_writer",
+        "_encoding",
+        "_fast_csv",
+        "_flush_on_insert",
+        "_flush_threshold_bytes",
+        "_flush_threshold_rows",
+        "_handle",
+        "_initially_empty",
+        "_last_sync",
+        "_latest_time",
+        "_mmap_encoding",
+        "_mmap_reads",
+        "_mode",
+        "_needs_quoting",
+        "_newline",
+        "_parallel_read",
+        "_parallel_read_min_rows",
+        "_path",
+        "_real_path",
+        "_sync_interval",
+        "_sync_pending",
+        "_sync_threshold_bytes",
+        "_temp_csv_writer",
+        "_temp_handle",
+        "_temp_path",
+        "_unsynced_bytes",
+        "_write_buf",
+        "kwargs",
+    )
 
     def __init__(
         self,
@@ -189,6 +263,15 @@ class CSVStorage(Storage):
         access_mode: str = "r+",
         flush_on_insert: bool = True,
         newline: Optional[str] = "",
+        flush_threshold_bytes: int = 0,
+        flush_threshold_rows: int = 0,
+        fast_csv: bool = False,
+        buffering: int = 1 << 20,
+        parallel_read: bool = False,
+        parallel_read_min_rows: int = 50000,
+        mmap_reads: bool = False,
+        sync_threshold_bytes: int = 0,
+        sync_interval: float = 0.0,
         **kwargs: Any,
     ) -> None:
         """Init a CSVStorage instance.
@@ -204,16 +287,76 @@ class CSVStorage(Storage):
             access_mode: File access mode.
             flush_on_insert: Whether or not to flush IO buffer immediately.
             newline: Determines how to parse newline characters from the stream
+            flush_threshold_bytes: Buffer appends in memory until this many
+                characters are pending. This is the byte count for ASCII
+                data. Disabled if 0.
+            flush_threshold_rows: Buffer appends in memory until this many
+                rows are pending. Disabled if 0.
+            fast_csv: Split unquoted rows directly instead of parsing them
+                with the csv module.
+            buffering: Buffer size of the file objects, in bytes.
+            parallel_read: Deserialize large reads in a pool of processes.
+            parallel_read_min_rows: With parallel_read, the fewest rows a read
+                must have to use the process pool.
+            mmap_reads: Read the file through a read-only memory map.
+            sync_threshold_bytes: With flush_on_insert, sync the file to disk
+                once this many characters have been appended. This is the byte
+                count for ASCII data. Every append is synced if this and
+                sync_interval are 0.
+            sync_interval: With flush_on_insert, sync the file to disk on
+                append if this many seconds have passed since the last sync.
         """
         super().__init__()
         self._encoding = encoding
         self._mode = access_mode
         self.kwargs = kwargs
+
+        # Access mode is fixed, so resolve the permitted ops once.
+        self._can_append = access_mode in ("r+", "w", "w+", "a", "a+")
+        self._can_read = access_mode in ("r+", "r", "w+", "a+")
+        self._can_write = access_mode in ("r+", "w", "w+")
         self._latest_time = None
         self._initially_empty = False
         self._path = path
+
+        # Swaps replace the file a symlinked path points to, not the link.
+        self._real_path = os.path.realpath(path)
         self._flush_on_insert = flush_on_insert
         self._newline = newline
+        self._buffering = buffering
+        self._parallel_read = parallel_read
+        self._parallel_read_min_rows = parallel_read_min_rows
+        self._flush_threshold_bytes = flush_threshold_bytes
+        self._flush_threshold_rows = flush_threshold_rows
+        self._sync_threshold_bytes = sync_threshold_bytes
+        self._sync_interval = sync_interval
+        self._unsynced_bytes = 0
+        self._sync_pending = False
+        self._last_sync = time.monotonic()
+
+        # Rows can be split and joined directly if the dialect only sets a
+        # delimiter, a quote character, or a line terminator.
+        simple_dialect = set(self.kwargs) <= {
+            "delimiter",
+            "quotechar",
+            "lineterminator",
+        }
+        self._fast_csv = fast_csv and simple_dialect
+
+        # Characters that require the csv module to quote a field.
+        self._needs_quoting = (
+            re.compile(
+                "["
+                + re.escape(
+                    self.kwargs.get("quotechar", '"')
+                    + self.kwargs.get("lineterminator", "\r\n")
+                    + "\r\n"
+                )
+                + "]"
+            )
+            if simple_dialect
+            else None
+        )
 
         # Create the file if it doesn't exist and creating is allowed.
         if any(i in self._mode for i in ("+", "w", "a")):
@@ -221,11 +364,38 @@ class CSVStorage(Storage):
 
         # Open the file for reading/writing
         self._handle = open(
-            path, mode=self._mode, encoding=encoding, newline=self._newline
+            path,
+            mode=self._mode,
+            buffering=self._buffering,
+            encoding=encoding,
+            newline=self._newline,
         )
 
+        # Reads are full sequential scans.
+        self._advise_sequential()
+
+        # Lines can be split on b"\n" in the raw file, for memory-mapped
+        # reads and line counts, with an ASCII-compatible encoding and a line
+        # terminator with a newline.
+        self._mmap_encoding = encoding or locale.getpreferredencoding(False)
+        ascii_newline = "\n".encode(self._mmap_encoding) == b"\n"
+        self._byte_lines = ascii_newline and "\n" in self.kwargs.get(
+            "lineterminator", "\n"
+        )
+        self._mmap_reads = mmap_reads and self._byte_lines
+
+        # Cache a CSV writer on the file handle.
+        self._csv_writer = csv.writer(self._handle, **self.kwargs)
+
         # Open a tempfile.
         self._temp_handle: Optional[Any] = None
+        self._temp_path: Optional[str] = None
+        self._temp_csv_writer: Any = None
+
+        # Init a write buffer for batched appends.
+        self._write_buf = io.StringIO(newline="")
+        self._buf_csv_writer = csv.writer(self._write_buf, **self.kwargs)
+        self._buf_rows = 0
 
         # Check if there is already data in the file.
         self._check_for_existing_data()
@@ -233,7 +403,7 @@ class CSVStorage(Storage):
     @property
     def can_append(self) -> bool:
         """Return whether or not appends can occur."""
-        if self._mode not in ("r+", "w", "w+", "a", "a+"):
+        if not self._can_append:
             raise IOError(
                 f'Cannot update the database. Access mode is "{self._mode}"'
             )
@@ -243,7 +413,7 @@ class CSVStorage(Storage):
     @property
     def can_read(self) -> bool:
         """Return whether or not reads can occur."""
-        if self._mode not in ("r+", "r", "w+", "a+"):
+        if not self._can_read:
             raise IOError(
                 f'Cannot update the database. Access mode is "{self._mode}"'
             )
@@ -253,24 +423,64 @@ class CSVStorage(Storage):
     @property
     def can_write(self) -> bool:
         """Return whether or not writes can occur."""
-        if self._mode not in ("r+", "w", "w+"):
+        if not self._can_write:
             raise IOError(
                 f'Cannot update the database. Access mode is "{self._mode}"'
             )
 
         return True
 
-    def __iter__(self) -> _csv.reader:  # type: ignore
+    def __iter__(self) -> Iterator[CSVStorageItem]:
         """Return a CSV reader object that can be iterated over."""
+        self.flush()
         self._handle.seek(0)
 
-        return csv.reader(self._handle, **self.kwargs)
+        lines = self._iter_mmap_lines() if self._mmap_reads else self._handle
+
+        if self._fast_csv:
+            return self._iter_fast(lines)
+
+        return csv.reader(lines, **self.kwargs)
 
     def __len__(self) -> int:
-        """Return the number of items."""
-        self._handle.seek(0)
+        """Return the number of items.
+
+        Counts newline bytes in large binary chunks rather than decoding the
+        file line-by-line.
+        """
+        self.flush()
 
-        return sum(1 for _ in self._handle)
+        # Encodings or line terminators that cannot be split on b"\n": count
+        # lines in text mode.
+        if not self._byte_lines:
+            self._handle.seek(0)
+            return sum(1 for _ in self._handle)
+
+        # Make pending writes visible to the raw file descriptor.
+        self._handle.flush()
+
+        if not os.stat(self._real_path).st_size:
+            return 0
+
+        count = 0
+        last_chunk = b""
+
+        fd = os.open(self._real_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            while True:
+                chunk = os.read(fd, self._read_chunk_size)
+                if not chunk:
+                    break
+                count += chunk.count(b"\n")
+                last_chunk = chunk
+        finally:
+            os.close(fd)
+
+        # The last line may not be terminated.
+        if not last_chunk.endswith(b"\n"):
+            count += 1
+
+        return count
 
     def append(
         self, items: List[CSVStorageItem], temporary: bool = False
@@ -281,50 +491,115 @@ class CSVStorage(Storage):
             items: A list of objects.
             temporary: Whether or not to append to temporary storage.
         """
-        # Switch on temporary arg.
+        # Buffer the rows if batched appends are enabled.
+        if not temporary and (
+            self._flush_threshold_bytes or self._flush_threshold_rows
+        ):
+            self._write_rows(self._write_buf, self._buf_csv_writer, items)
+            self._buf_rows += len(items)
+
+            if (
+                self._flush_threshold_bytes
+                and self._write_buf.tell() >= self._flush_threshold_bytes
+            ) or (
+                self._flush_threshold_rows
+                and self._buf_rows >= self._flush_threshold_rows
+            ):
+                self.flush()
+
+            return
+
+        # Temporary storage is synced once, before it is swapped in.
         if temporary:
             if not self._temp_handle:
                 raise IOError
-            else:
-                handle = self._temp_handle
-        else:
-            handle = self._handle
 
-        handle.seek(0, os.SEEK_END)
+            self._temp_handle.seek(0, os.SEEK_END)
+            self._write_rows(self._temp_handle, self._temp_csv_writer, items)
+
+            return
 
-        csv_writer = csv.writer(handle, **self.kwargs)
+        self._handle.seek(0, os.SEEK_END)
 
-        # Iterate over the points.
-        for item in items:
-            # Write the row.
-            csv_writer.writerow(item)
+        # Write the rows.
+        written = self._write_rows(self._handle, self._csv_writer, items)
 
         if self._flush_on_insert:
-            # Ensure the file has been written.
-            handle.flush()
-            os.fsync(handle.fileno())
-
-            # Remove data that is behind the new cursor.
-            handle.truncate()
+            self._sync_if_due(written)
 
         return
 
     def close(self) -> None:
         """Clean up data store.
 
-        Closes the file object.
+        Flushes buffered appends and closes the file object.
         """
+        if not self._handle.closed:
+            self._flush_buffer()
+
+            if self._flush_on_insert and self._sync_pending:
+                self.sync()
+
         self._handle.close()
 
         return
 
+    def flush(self) -> None:
+        """Write buffered appends to the CSV file."""
+        written = self._flush_buffer()
+
+        if written and self._flush_on_insert:
+            self._sync_if_due(written)
+
+        return
+
+    def sync(self) -> None:
+        """Write buffered appends and force pending writes to disk."""
+        self._flush_buffer()
+
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+
+        self._unsynced_bytes = 0
+        self._sync_pending = False
+        self._last_sync = time.monotonic()
+
+        return
+
     def read(self) -> List[Point]:
         """Read all items from the storage into memory.
 
+        If parallel reads are enabled and there are enough rows to amortize
+        the cost of starting processes, rows are deserialized in chunks by a
+        process pool.
+
         Returns:
             A list of Point objects.
         """
-        return super().read()
+        if not self._parallel_read:
+            return super().read()
+
+        rows = list(self)
+
+        if len(rows) < self._parallel_read_min_rows:
+            return list(map(self._deserialize_storage_item, rows))
+
+        # Imported here, multiprocessing is costly to load and rarely used.
+        from concurrent.futures import ProcessPoolExecutor
+
+        # One chunk per worker.
+        workers = os.cpu_count() or 1
+        chunk_size = -(-len(rows) // workers)
+        chunks = [
+            rows[i : i + chunk_size] for i in range(0, len(rows), chunk_size)
+        ]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return [
+                p
+                for chunk in executor.map(_deserialize_rows, chunks)
+                for p in chunk
+            ]
 
     def reset(self) -> None:
         """Reset the storage instance.
@@ -335,10 +610,22 @@ class CSVStorage(Storage):
 
         return
 
+    def _advise_sequential(self) -> None:
+        """Advise the OS that the file will be read sequentially."""
+        if hasattr(os, "posix_fadvise"):
+            advice = os.POSIX_FADV_SEQUENTIAL  # type: ignore[attr-defined]
+
+            # This is only a hint, e.g. pipes do not support it.
+            try:
+                os.posix_fadvise(self._handle.fileno(), 0, 0, advice)
+            except OSError:
+                pass
+
+        return
+
     def _check_for_existing_data(self) -> None:
         """Check the file for existing data, w/o reading data into memory."""
-        self._handle.seek(0, os.SEEK_END)
-        size = self._handle.tell()
+        size = os.fstat(self._handle.fileno()).st_size
 
         # If the file is empty, flip index_intact to True.
         if not size:
@@ -350,7 +637,14 @@ class CSVStorage(Storage):
         """Clean up temporary storage."""
         if self._temp_handle is not None:
             self._temp_handle.close()
+
+            # Remove the tempfile if it was not swapped into place.
+            if self._temp_path and os.path.exists(self._temp_path):
+                os.remove(self._temp_path)
+
             self._temp_handle = None
+            self._temp_path = None
+            self._temp_csv_writer = None
 
         return
 
@@ -360,18 +654,141 @@ class CSVStorage(Storage):
 
     def _deserialize_storage_item(self, row: CSVStorageItem) -> Point:
         """Deserialize a row from storage to a Point."""
-        return Point()._deserialize_from_list(row)
+        # Every attribute is set from the row, so skip Point.__init__.
+        return Point.__new__(Point)._deserialize_from_list(row)
 
     def _deserialize_timestamp(self, row: CSVStorageItem) -> datetime:
         """Deserialize timestamp from a row."""
         return datetime.fromisoformat(row[self._timestamp_idx])
 
+    def _flush_buffer(self) -> int:
+        """Write buffered appends to the file object.
+
+        Returns:
+            The number of characters written.
+        """
+        if not self._buf_rows:
+            return 0
+
+        self._handle.seek(0, os.SEEK_END)
+        written = self._handle.write(self._write_buf.getvalue())
+
+        # Reset the buffer.
+        self._write_buf.seek(0)
+        self._write_buf.truncate()
+        self._buf_rows = 0
+
+        return written
+
+    def _format_rows(self, items: List[CSVStorageItem]) -> str:
+        """Format rows as CSV text without the csv module.
+
+        Fields are joined on the delimiter. A row with a field that needs
+        quoting shows up as an extra delimiter or a special character in the
+        joined line, and is formatted by the csv module instead.
+
+        Args:
+            items: A list of rows.
+
+        Returns:
+            The rows as CSV text.
+        """
+        assert self._needs_quoting is not None
+        needs_quoting = self._needs_quoting.search
+        delimiter = self.kwargs.get("delimiter", ",")
+        lineterminator = self.kwargs.get("lineterminator", "\r\n")
+        lines: List[str] = []
+        append = lines.append
+
+        for row in items:
+            try:
+                line = delimiter.join(row)
+            except TypeError:
+                line = ""
+
+            if (
+                not line
+                or line.count(delimiter) != len(row) - 1
+                or needs_quoting(line)
+            ):
+                buf = io.StringIO(newline="")
+                csv.writer(buf, **self.kwargs).writerow(row)
+                append(buf.getvalue())
+                continue
+
+            append(line + lineterminator)
+
+        return "".join(lines)
+
     def _init_temp_storage(self) -> None:
         """Initialize temporary storage."""
-        self._temp_handle = NamedTemporaryFile("w+t", newline="", delete=False)
+        # Keep the tempfile next to the primary file so it can be renamed. If
+        # a file cannot be created there, e.g. the directory is not writable
+        # or is on a read-only filesystem, use the default temp directory and
+        # copy the contents over the primary file when swapping.
+        try:
+            fd, self._temp_path = mkstemp(dir=os.path.dirname(self._real_path))
+        except OSError:
+            fd, self._temp_path = mkstemp()
+
+        self._temp_handle = open(
+            fd,
+            mode="w+",
+            buffering=self._buffering,
+            encoding=self._encoding,
+            newline=self._newline,
+        )
+        self._temp_csv_writer = csv.writer(self._temp_handle, **self.kwargs)
 
         return
 
+    def _iter_fast(self, lines: Iterator[str]) -> Iterator[CSVStorageItem]:
+        """Iterate over rows, splitting unquoted lines on the delimiter.
+
+        The csv writer quotes any field containing the delimiter, the quote
+        character, or a line break, so a line without a quote character is a
+        complete row. Quoted rows are handed to the csv module.
+
+        Args:
+            lines: An iterator of lines in the file.
+        """
+        delimiter = self.kwargs.get("delimiter", ",")
+        quotechar = self.kwargs.get("quotechar", '"')
+
+        for line in lines:
+            if quotechar in line:
+                # Parse a single row, reading more lines if it spans several.
+                yield next(csv.reader(chain([line], lines), **self.kwargs))
+                continue
+
+            yield line.rstrip("\r\n").split(delimiter)
+
+    def _iter_mmap_lines(self) -> Iterator[str]:
+        """Iterate over lines of the file through a read-only memory map.
+
+        Falls back to the file object if the file cannot be mapped.
+        """
+        try:
+            mm = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped.
+            return
+        except OSError:
+            yield from self._handle
+            return
+
+        # Let the OS read ahead aggressively.
+        if sys.platform != "win32" and sys.version_info >= (3, 8):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+
+        encoding = self._mmap_encoding
+
+        try:
+            for line in iter(mm.readline, b""):
+                yield line.decode(encoding)
+        finally:
+            mm.close()
+
     def _serialize_point(
         self, point: Point, *args: Any, **kwargs: Any
     ) -> Sequence[Union[str, float, int]]:
@@ -382,23 +799,101 @@ class CSVStorage(Storage):
 
     def _swap_temp_with_primary(self) -> None:
         """Swap primary data store with temporary data store."""
-        if self._temp_handle is not None:
+        if self._temp_handle is not None and self._temp_path is not None:
+            temp_handle = self._temp_handle
+            temp_path = self._temp_path
+            rename = self._temp_renamable()
+            reuse_handle = self._temp_handle_reusable()
+
             # Close the primary storage file object.
             self._handle.close()
 
-            # Copy auxiliary storage to primary location.
-            shutil.copy(self._temp_handle.name, self._path)
+            # Ensure the auxiliary storage has been written.
+            temp_handle.flush()
+            os.fsync(temp_handle.fileno())
+
+            if not reuse_handle:
+                temp_handle.close()
+
+            if rename:
+                # Keep the permissions of the primary file.
+                shutil.copymode(self._real_path, temp_path)
+
+                # Atomically move auxiliary storage to primary location.
+                os.replace(temp_path, self._real_path)
+            else:
+                shutil.copyfile(temp_path, self._real_path)
+                os.remove(temp_path)
+
+            self._temp_path = None
+
+            if reuse_handle:
+                temp_handle.seek(0)
+                self._handle = temp_handle
+                self._csv_writer = self._temp_csv_writer
+                self._temp_handle = None
+                self._temp_csv_writer = None
+            else:
+                # Init a new file object with the initial handle reference.
+                self._handle = open(
+                    self._path,
+                    mode=self._mode,
+                    buffering=self._buffering,
+                    encoding=self._encoding,
+                    newline=self._newline,
+                )
+                self._csv_writer = csv.writer(self._handle, **self.kwargs)
+
+            self._advise_sequential()
+
+        return
+
+    def _sync_if_due(self, written: int) -> None:
+        """Sync the file to disk if the sync policy calls for it.
 
-            # Init a new file object with the initial handle reference.
-            self._handle = open(
-                self._path,
-                mode=self._mode,
-                encoding=self._encoding,
-                newline=self._newline,
+        Args:
+            written: The number of characters just written.
+        """
+        self._unsynced_bytes += written
+        self._sync_pending = True
+
+        if (
+            (not self._sync_threshold_bytes and not self._sync_interval)
+            or (
+                self._sync_threshold_bytes
+                and self._unsynced_bytes >= self._sync_threshold_bytes
+            )
+            or (
+                self._sync_interval
+                and time.monotonic() - self._last_sync >= self._sync_interval
             )
+        ):
+            self.sync()
 
         return
 
+    def _temp_handle_reusable(self) -> bool:
+        """Return whether the tempfile object can become the primary one.
+
+        The tempfile must be renamed into place and opened with the same
+        operations as the primary file. Open files cannot be renamed on
+        Windows.
+        """
+        return (
+            self._temp_renamable()
+            and os.name != "nt"
+            and self._mode in ("r+", "w+")
+        )
+
+    def _temp_renamable(self) -> bool:
+        """Return whether the tempfile can be renamed over the primary file.
+
+        Otherwise, its contents are copied over the primary file.
+        """
+        return self._temp_path is not None and os.path.dirname(
+            self._temp_path
+        ) == os.path.dirname(self._real_path)
+
     def _write(self, items: List[CSVStorageItem]) -> None:
         """Write Points to the CSV file.
 
@@ -413,25 +908,50 @@ class CSVStorage(Storage):
         """
         handle = self._handle
 
+        # Discard buffered appends, they are overwritten.
+        self._write_buf.seek(0)
+        self._write_buf.truncate()
+        self._buf_rows = 0
+
         # Dump the existing contents.
         handle.seek(0)
         handle.truncate()
 
         if items:
-            # Write the serialized data to the file
-            w = csv.writer(handle, **self.kwargs)
-            w.writerows(items)
-
-            # Ensure the file has been written.
-            handle.flush()
-            os.fsync(handle.fileno())
+            # Write the serialized data to the file. It was truncated above,
+            # so there is no stale data behind the new cursor.
+            self._write_rows(handle, self._csv_writer, items)
 
-            # Remove data that is behind the new cursor in case the file has
-            # gotten shorter
-            handle.truncate()
+            if self._flush_on_insert:
+                # Ensure the file has been written.
+                self.sync()
 
         return
 
+    def _write_rows(
+        self, handle: Any, csv_writer: Any, items: List[CSVStorageItem]
+    ) -> int:
+        """Write rows to a file object.
+
+        Args:
+            handle: The file object to write to.
+            csv_writer: A csv writer on the file object.
+            items: A list of rows.
+
+        Returns:
+            The number of characters written, or 0 if it is not tracked.
+        """
+        if self._needs_quoting is not None:
+            return handle.write(self._format_rows(items))
+
+        # Only the size-based sync policy needs a character count.
+        if self._sync_threshold_bytes:
+            return sum(map(csv_writer.writerow, items))
+
+        csv_writer.writerows(items)
+
+        return 0
+
 
 class MemoryStorage(Storage):
     """Define the in-memory storage instance for TinyFlux.
@@ -448,6 +968,8 @@ class MemoryStorage(Storage):
         >>> db = TinyFlux(storage=MemoryStorage)
     """
 
+    __slots__ = ("_initially_empty", "_memory", "_temp_memory")
+
     _initially_empty: bool
     _memory: List[MemStorageItem]
     _temp_memory: List[MemStorageItem]
@@ -477,11 +999,10 @@ class MemoryStorage(Storage):
             points: A list of Point objects.
             temporary: Whether or not to append to temporary storage.
         """
-        for item in items:
-            if temporary:
-                self._temp_memory.append(item)
-            else:
-                self._memory.append(item)
+        if temporary:
+            self._temp_memory.extend(items)
+        else:
+            self._memory.extend(items)
 
         return
 
@@ -493,6 +1014,14 @@ class MemoryStorage(Storage):
         """
         return super().read()
 
+    def read_iter(self) -> Iterator[Point]:
+        """Lazily read data from the store.
+
+        Returns:
+            An iterator of Point objects.
+        """
+        return iter(self._memory)
+
     def reset(self) -> None:
         """Reset the storage instance.
 
@@ -504,7 +1033,6 @@ class MemoryStorage(Storage):
 
     def _cleanup_temp_storage(self) -> None:
         """Clean up temporary storage."""
-        del self._temp_memory
         self._temp_memory = []
 
         return
@@ -552,7 +1080,160 @@ class MemoryStorage(Storage):
             items: A list of Point objects to serialize and write.
             temporary: Whether or not to write to temporary storage.
         """
-        del self._memory
         self._memory = items
 
         return
+
+
+class ColumnarMemoryStorage(Storage):
+    """Define a columnar in-memory storage instance for TinyFlux.
+
+    Points are kept in parallel columns: an array of timestamps as integer
+    microseconds since the epoch (UTC), and lists of measurements, tag sets,
+    and field sets. This avoids keeping a Point and a datetime object alive
+    for every item. Points are rebuilt when they are deserialized.
+
+    Memory is cleaned up along with the parent process.
+
+    Attributes:
+        _initially_empty: No data in the storage instance.
+        _columns: Timestamp, measurement, tag set, and field set columns.
+        _temp_columns: Temporary columns.
+
+    Usage:
+        >>> from tinyflux.storages import ColumnarMemoryStorage
+        >>> db = TinyFlux(storage=ColumnarMemoryStorage)
+    """
+
+    _epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    _one_microsecond = timedelta(microseconds=1)
+    __slots__ = ("_initially_empty", "_columns", "_temp_columns")
+
+    _initially_empty: bool
+    _columns: ColumnarColumns
+    _temp_columns: ColumnarColumns
+
+    def __init__(self) -> None:
+        """Init a ColumnarMemoryStorage instance."""
+        super().__init__()
+        self._initially_empty = True
+        self._columns = self._new_columns()
+        self._temp_columns = self._new_columns()
+
+    def __iter__(self) -> Iterator[ColumnarStorageItem]:
+        """Return a generator of rows that can be iterated over."""
+        return zip(*self._columns)
+
+    def __len__(self) -> int:
+        """Return the number of items."""
+        return len(self._columns[0])
+
+    def append(
+        self, items: List[ColumnarStorageItem], temporary: bool = False
+    ) -> None:
+        """Append rows to the columns.
+
+        Args:
+            items: A list of rows.
+            temporary: Whether or not to append to temporary storage.
+        """
+        if not items:
+            return
+
+        columns = self._temp_columns if temporary else self._columns
+        times, measurements, tags, fields = zip(*items)
+
+        columns[0].extend(times)
+        columns[1].extend(measurements)
+        columns[2].extend(tags)
+        columns[3].extend(fields)
+
+        return
+
+    def read(self) -> List[Point]:
+        """Read data from the store.
+
+        Returns:
+            A list of Point objects.
+        """
+        return super().read()
+
+    def reset(self) -> None:
+        """Reset the storage instance.
+
+        Removes all data.
+        """
+        self._write([])
+
+        return
+
+    def _cleanup_temp_storage(self) -> None:
+        """Clean up temporary storage."""
+        self._temp_columns = self._new_columns()
+
+        return
+
+    def _deserialize_measurement(self, item: ColumnarStorageItem) -> str:
+        """Deserialize measurement from a row."""
+        return item[1]
+
+    def _deserialize_storage_item(self, item: ColumnarStorageItem) -> Point:
+        """Deserialize a row from the columns to a Point."""
+        p = Point.__new__(Point)
+        p._time = self._epoch + timedelta(microseconds=item[0])
+        p._measurement = item[1]
+        p._tags = item[2]
+        p._fields = item[3]
+
+        return p
+
+    def _deserialize_timestamp(self, item: ColumnarStorageItem) -> datetime:
+        """Deserialize timestamp from a row."""
+        return self._epoch + timedelta(microseconds=item[0])
+
+    def _init_temp_storage(self) -> None:
+        """Initialize temporary storage."""
+        self._temp_columns = self._new_columns()
+
+    def _new_columns(self) -> ColumnarColumns:
+        """Return a new set of empty columns."""
+        return array("q"), [], [], []
+
+    def _serialize_point(
+        self, point: Point, *args: Any, **kwargs: Any
+    ) -> ColumnarStorageItem:
+        """Serialize a point to a row for storage."""
+        if not point.time:
+            raise ValueError("Point must have a time to be stored.")
+
+        # Naive timestamps are UTC, as in CSV storage.
+        t = point.time
+        if t.tzinfo is None:
+            t = t.replace(tzinfo=timezone.utc)
+
+        return (
+            (t - self._epoch) // self._one_microsecond,
+            point.measurement,
+            point.tags,
+            point.fields,
+        )
+
+    def _swap_temp_with_primary(self) -> None:
+        """Swap primary data store with temporary data store."""
+        self._columns = self._temp_columns
+
+        return
+
+    def _write(self, items: List[ColumnarStorageItem]) -> None:
+        """Write rows to the columns.
+
+        Write overwrites all content in memory. For appending, see the
+        'append' method.
+
+        Args:
+            items: A list of rows to write.
+        """
+        self._columns = self._new_columns()
+        self.append(items)
+
+        return
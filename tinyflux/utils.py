@@ -1,7 +1,9 @@
 """Definition of TinyFlux utils."""
 
 import bisect
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Tuple
+
+_SCALAR_TYPES = frozenset((str, int, float, bool, bytes, type(None)))
 
 
 class FrozenDict(dict):
@@ -15,10 +17,23 @@ class FrozenDict(dict):
     From TinyDB.
     """
 
+    _hash: int
+
     def __hash__(self) -> int:  # type: ignore
-        """Hash the value of a FrozenDict instance."""
-        # Calculate the has by hashing a tuple of all dict items
-        return hash(tuple(sorted(self.items())))
+        """Hash the value of a FrozenDict instance.
+
+        The instance is immutable, so the hash is computed once and cached.
+        """
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+
+        # Hash the items as a frozenset: order-independent, with no sort and
+        # no requirement that keys be comparable.
+        self._hash = hash(frozenset(self.items()))
+
+        return self._hash
 
     def _immutable(self, *args: Any, **kwargs: Any) -> None:
         """Raise a TypeError for a given dict method."""
@@ -48,6 +63,10 @@ def freeze(obj: object) -> object:
     Returns:
         The object in a hashable form.
     """
+    # Scalars are the most common values and are already hashable.
+    if type(obj) in _SCALAR_TYPES:
+        return obj
+
     if isinstance(obj, dict):
         return FrozenDict((k, freeze(v)) for k, v in obj.items())
     elif isinstance(obj, list):
@@ -76,6 +95,22 @@ def find_eq(sorted_list: List[Any], x: Any) -> Optional[int]:
     return None
 
 
+def find_eq_range(sorted_list: List[Any], x: Any) -> Tuple[int, int]:
+    """Locate the run of values exactly equal to x.
+
+    Args:
+        sorted_list: The list to search.
+        x: The element to search.
+
+    Returns:
+        The start and stop indices of the run. These are equal if x is absent.
+    """
+    i = bisect.bisect_left(sorted_list, x)
+    j = bisect.bisect_right(sorted_list, x, i)
+
+    return i, j
+
+
 def find_lt(sorted_list: List[Any], x: Any) -> Optional[int]:
     """Find rightmost value less than x.
 